@@ -85,6 +85,10 @@ This revision was tested with the following requirements and dependencies
 Revisions
 ---------
 
+2025.x.x
+
+- Return decoded channel image data in native byte order (breaking).
+
 2025.1.1
 
 - Improve type hints.
@@ -318,18 +322,21 @@ import dataclasses
 import enum
 import io
 import logging
+import math
+import mmap
 import os
 import struct
 import sys
 import zlib
 from concurrent.futures import ThreadPoolExecutor
-from functools import cached_property
+from contextlib import contextmanager
+from functools import cached_property, lru_cache
 from typing import TYPE_CHECKING, NamedTuple, cast
 
 import numpy
 
 if TYPE_CHECKING:
-    from collections.abc import Generator, Iterable
+    from collections.abc import Generator, Iterable, Iterator
     from typing import Any, BinaryIO, Literal
 
     from numpy.typing import DTypeLike, NDArray
@@ -349,7 +356,24 @@ class BytesEnumMeta(enum.EnumMeta):
             return False
         return True
 
+    def __new__(
+        metacls: Any, cls: str, bases: Any, classdict: Any, **kwds: Any
+    ) -> Any:
+        enum_class = super().__new__(metacls, cls, bases, classdict, **kwds)
+        # map little endian values to members
+        enum_class._reversed_map_ = {
+            member.value[::-1]: member for member in enum_class
+        }
+        return enum_class
+
     def __call__(cls: Any, *args: Any, **kwds: Any) -> Any:
+        if len(args) == 1 and not kwds and type(args[0]) is bytes:
+            # fast path for known big and little endian values
+            member = cls._value2member_map_.get(args[0])
+            if member is None:
+                member = cls._reversed_map_.get(args[0])
+            if member is not None:
+                return member
         try:
             # big endian
             c = enum.EnumMeta.__call__(cls, *args, **kwds)
@@ -379,11 +403,14 @@ class BytesEnum(bytes, enum.Enum, metaclass=BytesEnumMeta):
 
     def tobytes(self, byteorder: str = '>') -> bytes:
         """Return enum value as bytes."""
-        return self.value if byteorder == '>' else self.value[::-1]
+        # _value_ avoids the enum value descriptor; it is not precomputed
+        # because values of UNKNOWN members are replaced when read
+        data: bytes = self._value_
+        return data if byteorder == '>' else data[::-1]
 
     def write(self, fh: BinaryIO, byteorder: str = '>', /) -> int:
         """Write enum value to open file."""
-        return fh.write(self.value if byteorder == '>' else self.value[::-1])
+        return fh.write(self.tobytes(byteorder))
 
 
 class PsdKey(BytesEnum):
@@ -582,13 +609,17 @@ class PsdResourceId(enum.IntEnum):
     def _missing_(cls, value: object) -> object:
         assert isinstance(value, int)
         if 2000 <= value <= 2997:
-            obj = cls(2000)  # PATH_INFO
+            member = cls(2000)  # PATH_INFO
         elif 4000 <= value <= 4999:
-            obj = cls(4000)  # PATH_INFO
+            member = cls(4000)  # PLUGIN_RESOURCE
         else:
-            obj = cls(-1)  # UNKNOWN
+            member = cls(-1)  # UNKNOWN
+        # create pseudo-member once per value and reuse it instead of
+        # changing the value of the shared member
+        obj = int.__new__(cls, member)
+        obj._name_ = member._name_
         obj._value_ = value
-        return obj
+        return cls._value2member_map_.setdefault(value, obj)
 
 
 class PsdBlendMode(BytesEnum):
@@ -860,22 +891,23 @@ class PsdPascalString:
         size = fh.read(1)[0]
         if size > 255:
             raise ValueError(f'invalid length of pascal string, {size} > 255')
-        data = fh.read(size)
-        if len(data) != size:
+        # read string and padding at once
+        data = fh.read(size + (-(size + 1) % pad))
+        if len(data) < size:
             raise OSError(f'could not read enough data, {len(data)} != {size}')
-        value = data.decode('macroman')
-        fh.seek((pad - (size + 1) % pad) % pad, 1)
+        value = data[:size].decode('macroman')
         return cls(value=value)
 
     def write(self, fh: BinaryIO, pad: int = 1) -> int:
         """Write Pascal string to open file."""
+        return fh.write(self.tobytes(pad))
+
+    def tobytes(self, pad: int = 1) -> bytes:
+        """Return Pascal string as bytes."""
         value = self.value[:255]
         data = value.encode('macroman')
         size = len(data)
-        fh.write(struct.pack('B', size))
-        fh.write(data)
-        pad = fh.write(b'\0' * ((pad - (size + 1) % pad) % pad))
-        return 1 + size + pad
+        return b''.join((bytes((size,)), data, b'\0' * (-(size + 1) % pad)))
 
     def __str__(self) -> str:
         return self.value
@@ -898,19 +930,23 @@ class PsdUnicodeString:
         data = fh.read(size)
         if len(data) != size:
             raise OSError(f'could not read enough data, {len(data)} != {size}')
-        value = data.decode(psdformat.utf16)
-        if value and value[-1] == '\0':
-            value = value[:-1]
-        return cls(value=value)
+        if data[-2:] == b'\0\0':
+            # strip terminator before decoding
+            data = data[:-2]
+        return cls(value=data.decode(psdformat.utf16))
 
     def write(
         self, fh: BinaryIO, psdformat: PsdFormat, /, terminate: bool = True
     ) -> int:
         """Write unicode string to open file."""
+        return fh.write(self.tobytes(psdformat, terminate=terminate))
+
+    def tobytes(
+        self, psdformat: PsdFormat, /, terminate: bool = True
+    ) -> bytes:
+        """Return unicode string as bytes."""
         value = self.value + '\0' if terminate else self.value
-        written = psdformat.write(fh, 'I', len(value))
-        written += fh.write(value.encode(psdformat.utf16))
-        return written
+        return psdformat.pack('I', len(value)) + value.encode(psdformat.utf16)
 
     def __str__(self) -> str:
         return self.value
@@ -927,14 +963,14 @@ class PsdFormat(bytes, enum.Enum):
     BE64BIT = b'8B64'
     LE64BIT = b'46B8'
 
-    @property
+    @cached_property
     def byteorder(self) -> Literal['>', '<']:
         """Byte-order of PSD format."""
         if self.value in {PsdFormat.BE32BIT, PsdFormat.BE64BIT}:
             return '>'
         return '<'
 
-    @property
+    @cached_property
     def sizeformat(self) -> str:
         """Struct format string for size values."""
         if self.value == b'8BIM':
@@ -948,41 +984,70 @@ class PsdFormat(bytes, enum.Enum):
             return '>Q'
         return '<Q'
 
-    @property
+    @cached_property
     def utf16(self) -> str:
         """UTF-16 encoding."""
         if self.value in {PsdFormat.BE32BIT, PsdFormat.BE64BIT}:
             return 'UTF-16-BE'
         return 'UTF-16-LE'
 
-    @property
+    @cached_property
     def isb64(self) -> bool:
         """PSD format is 64-bit."""
         return self.value in {PsdFormat.BE64BIT, PsdFormat.LE64BIT}
 
+    @cached_property
+    def rlecountfmt(self) -> str:
+        """Data type of RLE compressed row byte counts."""
+        return self.byteorder + ('I' if self.isb64 else 'H')
+
     def read(self, fh: BinaryIO, fmt: str) -> Any:
         """Return unpacked values."""
-        fmt = self.byteorder + fmt
-        value = struct.unpack(fmt, fh.read(struct.calcsize(fmt)))
+        st = self._struct(fmt)
+        value = st.unpack(fh.read(st.size))
         return value[0] if len(value) == 1 else value
 
     def write(self, fh: BinaryIO, fmt: str, *values: Any) -> int:
         """Write values to open file."""
-        return fh.write(struct.pack(self.byteorder + fmt, *values))
+        return fh.write(self._struct(fmt).pack(*values))
 
     def pack(self, fmt: str, *values: Any) -> bytes:
         """Return packed values."""
-        return struct.pack(self.byteorder + fmt, *values)
+        return self._struct(fmt).pack(*values)
+
+    def unpack_from(self, fmt: str, buffer: Any, /, offset: int = 0) -> Any:
+        """Return values unpacked from buffer at offset."""
+        value = self._struct(fmt).unpack_from(buffer, offset)
+        return value[0] if len(value) == 1 else value
+
+    @lru_cache(maxsize=None)
+    def _struct(self, fmt: str, /) -> struct.Struct:
+        """Return compiled struct for format in byte order."""
+        return struct.Struct(self.byteorder + fmt)
 
     def read_size(self, fh: BinaryIO, key: PsdKey | None = None) -> int:
         """Return integer whose size depends on signature or key from file."""
-        if key is None:
-            fmt = self.sizeformat
-        elif self.isb64 and key in PSD_KEY_64BIT:
-            fmt = self.sizeformat  # TODO: test this
+        if key is None or (self.isb64 and key in PSD_KEY_64BIT):
+            fmt = self.sizeformat[1:]
         else:
-            fmt = self.byteorder + 'I'
-        return int(struct.unpack(fmt, fh.read(struct.calcsize(fmt)))[0])
+            fmt = 'I'
+        st = self._struct(fmt)
+        return int(st.unpack(fh.read(st.size))[0])
+
+    def read_header(self, fh: BinaryIO, /) -> tuple[PsdKey, int] | None:
+        """Return key and size of tagged structure from open file.
+
+        Return None if the signature does not match the format.
+
+        """
+        # signature, key, and 32-bit size in one read
+        header = fh.read(12)
+        if len(header) != 12 or header[:4] != self:
+            return None
+        key = PsdKey(header[4:8])
+        if self.isb64 and key in PSD_KEY_64BIT:
+            return key, int(self.unpack_from('Q', header[8:] + fh.read(4)))
+        return key, int(self.unpack_from('I', header, 8))
 
     def write_size(
         self, fh: BinaryIO, value: int, key: PsdKey | None = None
@@ -992,30 +1057,34 @@ class PsdFormat(bytes, enum.Enum):
 
     def pack_size(self, value: int, key: PsdKey | None = None) -> bytes:
         """Pack integer whose size depends on signature or key."""
-        if key is None:
-            fmt = self.sizeformat
-        elif self.isb64 and key in PSD_KEY_64BIT:
-            fmt = self.sizeformat  # TODO: test this
+        if key is None or (self.isb64 and key in PSD_KEY_64BIT):
+            fmt = self.sizeformat[1:]
         else:
-            fmt = self.byteorder + 'I'
-        return struct.pack(fmt, value)
+            fmt = 'I'
+        return self._struct(fmt).pack(value)
 
     def write_signature(self, fh: BinaryIO, signature: bytes, /) -> int:
         """Write signature to file."""
-        return fh.write(
-            signature if self.byteorder == '>' else signature[::-1]
-        )
+        return fh.write(self.pack_signature(signature))
+
+    def pack_signature(self, signature: bytes, /) -> bytes:
+        """Return signature in byte order."""
+        return signature if self.byteorder == '>' else signature[::-1]
 
     def write_key(self, fh: BinaryIO, key: PsdKey, /) -> int:
         """Write signature to file."""
-        return fh.write(
-            key.value if self.byteorder == '>' else key.value[::-1]
-        )
+        return fh.write(self.pack_key(key))
+
+    def pack_key(self, key: PsdKey, /) -> bytes:
+        """Return key in byte order."""
+        return key.tobytes(self.byteorder)
 
 
 class PsdKeyABC(metaclass=abc.ABCMeta):
     """Abstract base class for structures with key."""
 
+    __slots__ = ()
+
     key: PsdKey
 
     @classmethod
@@ -1068,6 +1137,8 @@ class PsdLayers(PsdKeyABC):
         PsdKey.LAYER_32: 'f',  # float32
     }
 
+    DTYPES = frozenset(TYPES.values())
+
     @classmethod
     def read(
         cls,
@@ -1077,6 +1148,7 @@ class PsdLayers(PsdKeyABC):
         /,
         length: int,
         unknown: bool = True,
+        maxworkers: int = 1,
     ) -> PsdLayers:
         """Return instance from open file."""
         count = psdformat.read(fh, 'h')
@@ -1084,20 +1156,36 @@ class PsdLayers(PsdKeyABC):
         count = abs(count)
 
         # layer records
-        layers: list[PsdLayer] = []
-        for _ in range(count):
-            layers.append(PsdLayer.read(fh, psdformat, unknown=unknown))
+        layers = [
+            PsdLayer.read(fh, psdformat, unknown=unknown) for _ in range(count)
+        ]
 
         # channel image data
         dtype = PsdLayers.TYPES[key]
         shape: tuple[int, ...] = ()
+        jobs: list[tuple[PsdChannel, bytes, tuple[int, ...]]] = []
         for layer in layers:
             for channel in layer.channels:
                 if channel.channelid < -1 and layer.mask is not None:
                     shape = layer.mask.shape
                 else:
                     shape = layer.shape
-                channel.read_image(fh, psdformat, shape, dtype)
+                if maxworkers > 1:
+                    # defer decompression to thread pool
+                    data = fh.read(channel._data_length)
+                    jobs.append((channel, data, shape))
+                else:
+                    channel.read_image(fh, psdformat, shape, dtype)
+
+        if jobs:
+
+            def func(job: tuple[PsdChannel, bytes, tuple[int, ...]]) -> None:
+                channel, data, shape = job
+                channel._decode_image(data, psdformat, shape, dtype)
+
+            maxworkers = min(maxworkers, len(jobs))
+            with ThreadPoolExecutor(maxworkers) as executor:
+                list(executor.map(func, jobs))
 
         return cls(
             key=key,
@@ -1113,11 +1201,17 @@ class PsdLayers(PsdKeyABC):
         key: PsdKey,
         /,
         unknown: bool = True,
+        maxworkers: int = 1,
     ) -> PsdLayers:
         """Return instance from bytes."""
         with io.BytesIO(data) as fh:
             self = cls.read(
-                fh, psdformat, key, length=len(data), unknown=unknown
+                fh,
+                psdformat,
+                key,
+                length=len(data),
+                unknown=unknown,
+                maxworkers=maxworkers,
             )
         return self
 
@@ -1137,19 +1231,28 @@ class PsdLayers(PsdKeyABC):
             fh, 'h', (-1 if self.has_transparency else 1) * len(self.layers)
         )
         # layer records
-        channel_image_data = []
-        for layer in self.layers:
-            data = layer.write(
-                fh,
-                psdformat,
-                compression=compression,
-                unknown=unknown,
-                maxworkers=maxworkers,
-            )
-            channel_image_data.append(data)
+        # channel image data are kept as list of records to avoid joining
+        channel_image_data: list[bytes] = []
+        if compression == 0 or maxworkers <= 1 or len(self.layers) < 2:
+            for layer in self.layers:
+                record, data = layer._records(
+                    psdformat, compression, unknown, maxworkers
+                )
+                fh.write(record)
+                channel_image_data.extend(data)
+        else:
+            # compress layers in parallel and write records in order
+
+            def func(layer: PsdLayer) -> tuple[bytes, list[bytes]]:
+                return layer._records(psdformat, compression, unknown, 1)
+
+            maxworkers = min(maxworkers, len(self.layers))
+            with ThreadPoolExecutor(maxworkers) as executor:
+                for record, data in executor.map(func, self.layers):
+                    fh.write(record)
+                    channel_image_data.extend(data)
         # channel info data
-        for data in channel_image_data:
-            fh.write(data)
+        fh.writelines(channel_image_data)
         size = fh.tell() - pos
         if size % 2:
             # length of layers info must be multiple of 2
@@ -1198,6 +1301,13 @@ class PsdLayers(PsdKeyABC):
                     shape[1] = layer.mask.rectangle[3]
         return shape[0], shape[1]
 
+    @property
+    def rectangles(self) -> NDArray[numpy.int32]:
+        """Top, left, bottom, and right of all layer rectangles."""
+        return numpy.array(
+            [layer.rectangle for layer in self.layers], dtype=numpy.int32
+        ).reshape(-1, 4)
+
     def __bool__(self) -> bool:
         return len(self.layers) > 0
 
@@ -1249,22 +1359,41 @@ class PsdLayer:
         Channel image data must be read separately.
 
         """
-        rectangle = PsdRectangle(*psdformat.read(fh, 'iiii'))
-        count = psdformat.read(fh, 'H')
-        channels = []
-        for _ in range(count):
-            channels.append(PsdChannel.read(fh, psdformat))
+        # rectangle and number of channels in one read
+        *rect, count = psdformat.read(fh, 'iiiiH')
+        rectangle = PsdRectangle(*rect)
+        # channel ids and sizes of channel data in one read
+        st = psdformat._struct('h' + psdformat.sizeformat[1:])
+        data = fh.read(st.size * count)
+        if len(data) != st.size * count:
+            raise OSError(
+                f'could not read enough data, {len(data)} != {st.size * count}'
+            )
+        channels = [
+            PsdChannel(
+                channelid=PsdChannelId(channelid), _data_length=data_length
+            )
+            for channelid, data_length in st.iter_unpack(data)
+        ]
 
-        signature = fh.read(4)
+        # blend mode, opacity, clipping, flags, filler, and extra data size
+        data = fh.read(16)
+        if len(data) != 16:
+            raise OSError(f'could not read enough data, {len(data)} != 16')
+        (
+            signature,
+            blendmode,
+            opacity,
+            clipping,
+            flags,
+            filler,
+            extra_size,
+        ) = psdformat.unpack_from('4s4sBBBBI', data)
         assert signature in (b'8BIM', b'MIB8')
-        blendmode = PsdBlendMode(fh.read(4))
-        opacity = fh.read(1)[0]
-        clipping = PsdClippingType(fh.read(1)[0])
-        flags = PsdLayerFlag(fh.read(1)[0])
-        filler = fh.read(1)[0]
         assert filler == 0
-
-        extra_size = psdformat.read(fh, 'I')
+        blendmode = PsdBlendMode(blendmode)
+        clipping = PsdClippingType(clipping)
+        flags = PsdLayerFlag(flags)
         end = fh.tell() + extra_size
 
         # layer mask data
@@ -1318,14 +1447,27 @@ class PsdLayer:
         maxworkers: int = 1,
     ) -> bytes:
         """Write layer record to open file and return channel data records."""
-        psdformat.write(fh, 'iiii', *self.rectangle)
-        psdformat.write(fh, 'H', len(self.channels))
+        layer_record, channel_image_data = self._records(
+            psdformat, compression, unknown, maxworkers
+        )
+        fh.write(layer_record)
+        return b''.join(channel_image_data)
 
-        channel_image_data = []
+    def _records(
+        self,
+        psdformat: PsdFormat,
+        compression: PsdCompressionType | None,
+        unknown: bool,
+        maxworkers: int,
+        /,
+    ) -> tuple[bytes, list[bytes]]:
+        """Return layer record and list of channel image data records."""
+        # channel info and image data records
         if compression == 0 or maxworkers <= 1 or len(self.channels) == 1:
-            for channel in self.channels:
-                data = channel.write(fh, psdformat, compression=compression)
-                channel_image_data.append(data)
+            records = [
+                channel.tobytes(psdformat, compression=compression)
+                for channel in self.channels
+            ]
         else:
 
             def func(channel: PsdChannel) -> tuple[bytes, bytes]:
@@ -1333,48 +1475,55 @@ class PsdLayer:
 
             maxworkers = min(maxworkers, len(self.channels))
             with ThreadPoolExecutor(maxworkers) as executor:
-                for info, data in executor.map(func, self.channels):
-                    fh.write(info)
-                    channel_image_data.append(data)
-
-        psdformat.write_signature(fh, b'8BIM')  # blend mode signature
-        psdformat.write(
-            fh,
-            '4sBBBB',
-            self.blendmode.tobytes(psdformat.byteorder),
-            self.opacity,
-            self.clipping.value,
-            self.flags,
-            0,
-        )
-
-        extra_size_pos = fh.tell()
-        psdformat.write(fh, 'I', 0)  # placeholder
-        pos = fh.tell()
+                records = list(executor.map(func, self.channels))
+        channel_image_data = [data for _, data in records]
 
         # layer mask data
         if self.mask is None:
-            psdformat.write(fh, 'I', 0)
+            mask = psdformat.pack('I', 0)
         else:
-            size = self.mask.write(fh, psdformat)
-            assert size in (4, 24, 40)
+            mask = self.mask.tobytes(psdformat)
+            assert len(mask) in (4, 24, 40)
 
-        # layer blending ranges
-        psdformat.write(fh, 'I', len(self.blending_ranges) * 4)
-        psdformat.write(
-            fh, 'i' * len(self.blending_ranges), *self.blending_ranges
+        # additional layer information
+        with io.BytesIO() as buffer:
+            write_psdtags(
+                buffer, psdformat, compression, unknown, 1, 2, *self.info
+            )
+            tags = buffer.getvalue()
+
+        # extra data: mask, blending ranges, name, and additional info
+        extra = b''.join(
+            (
+                mask,
+                psdformat.pack(
+                    f'I{len(self.blending_ranges)}i',
+                    len(self.blending_ranges) * 4,
+                    *self.blending_ranges,
+                ),
+                PsdPascalString(self.name).tobytes(pad=4),
+                tags,
+            )
         )
 
-        PsdPascalString(self.name).write(fh, pad=4)
-
-        write_psdtags(fh, psdformat, compression, unknown, 1, 2, *self.info)
-
-        extra_size = fh.tell() - pos
-        fh.seek(extra_size_pos)
-        psdformat.write(fh, 'I', extra_size)
-        fh.seek(extra_size, 1)
-
-        return b''.join(channel_image_data)
+        layer_record = b''.join(
+            (
+                psdformat.pack('iiiiH', *self.rectangle, len(self.channels)),
+                *(channel_info for channel_info, _ in records),
+                psdformat.pack_signature(b'8BIM'),  # blend mode
+                psdformat.pack(
+                    '4sBBBBI',
+                    self.blendmode.tobytes(psdformat.byteorder),
+                    self.opacity,
+                    self.clipping.value,
+                    self.flags,
+                    0,
+                    len(extra),
+                ),
+                extra,
+            )
+        )
+        return layer_record, channel_image_data
 
     def tobytes(
         self,
@@ -1385,16 +1534,10 @@ class PsdLayer:
         maxworkers: int = 1,
     ) -> tuple[bytes, bytes]:
         """Return layer and channel data records."""
-        with io.BytesIO() as fh:
-            channel_image_data = self.write(
-                fh,
-                psdformat,
-                compression=compression,
-                unknown=unknown,
-                maxworkers=maxworkers,
-            )
-            layer_record = fh.getvalue()
-        return layer_record, channel_image_data
+        layer_record, channel_image_data = self._records(
+            psdformat, compression, unknown, maxworkers
+        )
+        return layer_record, b''.join(channel_image_data)
 
     def asarray(
         self, channelid: PsdChannelId | None = None, planar: bool = False
@@ -1421,9 +1564,8 @@ class PsdLayer:
         if len(datalist) == 1:
             data = datalist[0]
         else:
-            data = numpy.stack(datalist)
-            if not planar:
-                data = numpy.moveaxis(data, 0, -1)
+            # stack along last axis to return contiguous interleaved data
+            data = numpy.stack(datalist, axis=0 if planar else -1)
         return data
 
     @property
@@ -1462,27 +1604,33 @@ class PsdLayer:
         )
 
     def __repr__(self) -> str:
-        szc = len(self.channels)
-        szi = len(self.info)
+        channels = indent(*self.channels, sep=',')
+        info = indent(*self.info, sep=',')
         return indent(
             f'{self.__class__.__name__}(',
             f'name={self.name!r},',
-            f'channels=[  # {szc}\n    {indent(*self.channels, sep=",")},\n],',
+            f'channels=[  # {len(self.channels)}\n    {channels},\n],',
             f'rectangle={self.rectangle},',
-            f'mask={self.mask},',
+            f'mask={self.mask!r},',
             f'opacity={self.opacity},',
             f'blendmode={enumstr(self.blendmode)},',
             f'blending_ranges={self.blending_ranges},',
             f'clipping={enumstr(self.clipping)},',
             f'flags={enumstr(self.flags)},',
-            f'info=[  # {szi}\n    {indent(*self.info, sep=",")},\n],',
+            f'info=[  # {len(self.info)}\n    {info},\n],',
             end='\n)',
         )
 
 
 @dataclasses.dataclass(repr=False)
 class PsdChannel:
-    """ChannelInfo and ChannelImageData."""
+    """ChannelInfo and ChannelImageData.
+
+    Channel image data read from files are decoded to native byte order,
+    for example, uint16 instead of >u2.
+    Channel image data are always written in big-endian byte order.
+
+    """
 
     channelid: PsdChannelId
     compression: PsdCompressionType = PsdCompressionType.RAW
@@ -1497,8 +1645,11 @@ class PsdChannel:
         :py:meth:`PsdChannel.read_image`.
 
         """
-        channelid = PsdChannelId(psdformat.read(fh, 'h'))
-        data_length = psdformat.read_size(fh)
+        # channel id and size of channel data in one read
+        channelid, data_length = psdformat.read(
+            fh, 'h' + psdformat.sizeformat[1:]
+        )
+        channelid = PsdChannelId(channelid)
         return cls(channelid=channelid, _data_length=data_length)
 
     @classmethod
@@ -1519,15 +1670,34 @@ class PsdChannel:
         """Read channel image data from open file."""
         if self.data is not None:
             raise RuntimeError
+        self._decode_image(fh.read(self._data_length), psdformat, shape, dtype)
 
-        self.compression = PsdCompressionType(psdformat.read(fh, 'H'))
-
-        data = fh.read(self._data_length - 2)
-        rlecountfmt = psdformat.byteorder + ('I' if psdformat.isb64 else 'H')
+    def _decode_image(
+        self,
+        data: bytes,
+        psdformat: PsdFormat,
+        /,
+        shape: tuple[int, ...],
+        dtype: DTypeLike,
+    ) -> None:
+        """Decode channel image data record read from file."""
+        if self.data is not None:
+            raise RuntimeError
 
-        self.data = decompress(
-            data, self.compression, shape, dtype, rlecountfmt
+        self.compression = PsdCompressionType(psdformat.unpack_from('H', data))
+        image = decompress(
+            memoryview(data)[2:],
+            self.compression,
+            shape,
+            dtype,
+            psdformat.rlecountfmt,
         )
+        if not image.dtype.isnative:
+            # convert big-endian image data to native byte order once
+            image = image.byteswap(inplace=image.flags.writeable).view(
+                image.dtype.newbyteorder('=')
+            )
+        self.data = image
 
     def tobytes(
         self,
@@ -1544,16 +1714,19 @@ class PsdChannel:
             compression = PsdCompressionType(compression)
         channel_image_data = psdformat.pack('H', compression)
 
-        dtype = self.data.dtype.newbyteorder(psdformat.byteorder)
-        if dtype.char not in PsdLayers.TYPES.values():
-            raise ValueError(f'dtype {dtype!r} not supported')
-        data = numpy.asarray(self.data, dtype=dtype)
-        rlecountfmt = psdformat.byteorder + ('I' if psdformat.isb64 else 'H')
-
-        channel_image_data += compress(data, compression, rlecountfmt)
+        if self.data.dtype.char not in PsdLayers.DTYPES:
+            raise ValueError(f'dtype {self.data.dtype!r} not supported')
+        # compress converts to big-endian once; copies only if needed
+        channel_image_data += compress(
+            self.data, compression, psdformat.rlecountfmt
+        )
 
-        channel_info = psdformat.pack('h', self.channelid)
-        channel_info += psdformat.pack_size(len(channel_image_data))
+        # channel id and size of channel data in one pack
+        channel_info = psdformat.pack(
+            'h' + psdformat.sizeformat[1:],
+            self.channelid,
+            len(channel_image_data),
+        )
 
         return channel_info, channel_image_data
 
@@ -1575,9 +1748,7 @@ class PsdChannel:
         return (
             isinstance(other, self.__class__)
             and self.channelid == other.channelid
-            and numpy.array_equal(
-                self.data, other.data  # type: ignore[arg-type]
-            )
+            and array_equal(self.data, other.data)
             # and self.compression == other.compression
         )
 
@@ -1620,34 +1791,46 @@ class PsdLayerMask:
         if size == 0:
             return cls()
 
-        rectangle = PsdRectangle(*psdformat.read(fh, 'iiii'))
-        default_color = fh.read(1)[0]
-        flags = PsdLayerMaskFlag(fh.read(1)[0])
+        # parse mask structure from one read
+        data = fh.read(size)
+        if len(data) != size:
+            raise OSError(f'could not read enough data, {len(data)} != {size}')
+        *rect, default_color, flags = psdformat.unpack_from('iiiiBB', data)
+        rectangle = PsdRectangle(*rect)
+        flags = PsdLayerMaskFlag(flags)
+        offset = 18
 
         user_mask_density = None
         user_mask_feather = None
         vector_mask_density = None
         vector_mask_feather = None
         if flags & 0b1000:
-            param_flags = PsdLayerMaskParameterFlag(fh.read(1)[0])
+            param_flags = PsdLayerMaskParameterFlag(data[offset])
+            offset += 1
             if param_flags & PsdLayerMaskParameterFlag.USER_DENSITY:
-                user_mask_density = fh.read(1)[0]
+                user_mask_density = data[offset]
+                offset += 1
             if param_flags & PsdLayerMaskParameterFlag.USER_FEATHER:
-                user_mask_feather = psdformat.read(fh, 'd')
+                user_mask_feather = psdformat.unpack_from('d', data, offset)
+                offset += 8
             if param_flags & PsdLayerMaskParameterFlag.VECTOR_DENSITY:
-                vector_mask_density = fh.read(1)[0]
+                vector_mask_density = data[offset]
+                offset += 1
             if param_flags & PsdLayerMaskParameterFlag.VECTOR_FEATHER:
-                vector_mask_feather = psdformat.read(fh, 'd')
+                vector_mask_feather = psdformat.unpack_from('d', data, offset)
+                offset += 8
 
         if size == 20:
-            fh.seek(2, 1)  # padding
+            # padding
             real_flags = None
             real_background = None
             real_rectangle = None
         else:
-            real_flags = PsdLayerMaskFlag(fh.read(1)[0])
-            real_background = fh.read(1)[0]
-            real_rectangle = PsdRectangle(*psdformat.read(fh, 'iiii'))
+            real_flags, real_background, *rect = psdformat.unpack_from(
+                'BBiiii', data, offset
+            )
+            real_flags = PsdLayerMaskFlag(real_flags)
+            real_rectangle = PsdRectangle(*rect)
 
         return cls(
             rectangle=rectangle,
@@ -1679,33 +1862,40 @@ class PsdLayerMask:
         if param_flags:
             flags = flags | 0b1000
 
-        data = psdformat.pack('iiii', *self.rectangle)
-        data += psdformat.pack('B', 255 if self.default_color else 0)
-        data += psdformat.pack('B', flags)
+        # build format and values to pack size and structure at once
+        fmt = 'iiiiBB'
+        values: list[Any] = [
+            *self.rectangle,
+            255 if self.default_color else 0,
+            flags,
+        ]
         if param_flags:
-            data += psdformat.pack('B', param_flags)
+            fmt += 'B'
+            values.append(param_flags)
             if self.user_mask_density is not None:
-                data += psdformat.pack('B', self.user_mask_density)
+                fmt += 'B'
+                values.append(self.user_mask_density)
             if self.user_mask_feather is not None:
-                data += psdformat.pack('d', self.user_mask_feather)
+                fmt += 'd'
+                values.append(self.user_mask_feather)
             if self.vector_mask_density is not None:
-                data += psdformat.pack('B', self.vector_mask_density)
+                fmt += 'B'
+                values.append(self.vector_mask_density)
             if self.vector_mask_feather is not None:
-                data += psdformat.pack('d', self.vector_mask_feather)
+                fmt += 'd'
+                values.append(self.vector_mask_feather)
             assert self.real_flags is not None
             assert self.real_background is not None
             assert self.real_rectangle is not None
-            data += psdformat.pack(
-                'BB4i',
-                self.real_flags,
-                self.real_background,
-                *self.real_rectangle,
+            fmt += 'BB4i'
+            values.extend(
+                (self.real_flags, self.real_background, *self.real_rectangle)
             )
         else:
-            data += b'\0\0'
-            assert len(data) == 20
-
-        return psdformat.pack('I', len(data)) + data
+            fmt += '2x'
+        size = psdformat._struct(fmt).size
+        assert param_flags or size == 20
+        return psdformat.pack('I' + fmt, size, *values)
 
     def write(self, fh: BinaryIO, psdformat: PsdFormat, /) -> int:
         """Write layer mask structure to open file."""
@@ -1787,26 +1977,28 @@ class PsdUserMask(PsdKeyABC):
         length: int,
     ) -> PsdUserMask:
         """Return instance from open file."""
-        colorspace = PsdColorSpaceType(psdformat.read(fh, 'h'))
-        fmt = '4h' if colorspace == PsdColorSpaceType.Lab else '4H'
-        components = psdformat.read(fh, fmt)
-        opacity = psdformat.read(fh, 'H')
-        flag = fh.read(1)[0]
+        # color space, components, opacity, and flag in one read
+        data = fh.read(13)
+        colorspace = PsdColorSpaceType(psdformat.unpack_from('h', data))
+        fmt = '4hHB' if colorspace == PsdColorSpaceType.Lab else '4HHB'
+        *components, opacity, flag = psdformat.unpack_from(fmt, data, 2)
         return cls(
             colorspace=colorspace,
-            components=components,
+            components=tuple(components),
             opacity=opacity,
             flag=flag,
         )
 
     def tobytes(self, psdformat: PsdFormat, /) -> bytes:
         """Return user mask record."""
-        data = psdformat.pack('h', self.colorspace.value)
         fmt = '4h' if self.colorspace == PsdColorSpaceType.Lab else '4H'
-        data += psdformat.pack(fmt, *self.components)
-        data += psdformat.pack('HB', self.opacity, self.flag)
-        data += b'\0'
-        return data
+        return psdformat.pack(
+            f'h{fmt}HBx',
+            self.colorspace.value,
+            *self.components,
+            self.opacity,
+            self.flag,
+        )
 
     def write(self, fh: BinaryIO, psdformat: PsdFormat, /) -> int:
         """Write user mask record to open file."""
@@ -1842,23 +2034,23 @@ class PsdFilterMask(PsdKeyABC):
         length: int,
     ) -> PsdFilterMask:
         """Return instance from open file."""
-        colorspace = PsdColorSpaceType(psdformat.read(fh, 'h'))
-        fmt = '4h' if colorspace == PsdColorSpaceType.Lab else '4H'
-        components = psdformat.read(fh, fmt)
-        opacity = psdformat.read(fh, 'H')
+        # color space, components, and opacity in one read
+        data = fh.read(12)
+        colorspace = PsdColorSpaceType(psdformat.unpack_from('h', data))
+        fmt = '4hH' if colorspace == PsdColorSpaceType.Lab else '4HH'
+        *components, opacity = psdformat.unpack_from(fmt, data, 2)
         return cls(
             colorspace=colorspace,
-            components=components,
+            components=tuple(components),
             opacity=opacity,
         )
 
     def tobytes(self, psdformat: PsdFormat, /) -> bytes:
         """Return filter mask record."""
-        data = psdformat.pack('h', self.colorspace.value)
         fmt = '4h' if self.colorspace == PsdColorSpaceType.Lab else '4H'
-        data += psdformat.pack(fmt, *self.components)
-        data += psdformat.pack('H', self.opacity)
-        return data
+        return psdformat.pack(
+            f'h{fmt}H', self.colorspace.value, *self.components, self.opacity
+        )
 
     def write(self, fh: BinaryIO, psdformat: PsdFormat, /) -> int:
         """Write filter mask record to open file."""
@@ -1926,11 +2118,17 @@ class PsdPatterns(PsdKeyABC):
         length_pos = fh.tell()
         psdformat.write(fh, 'I', 0)  # length placeholder
         pos = fh.tell()
-        psdformat.write(fh, 'I', 1)  # version
-        psdformat.write(fh, 'I', self.imagemode.value)
-        psdformat.write(fh, 'hh', *self.point)
-        PsdUnicodeString(self.name).write(fh, psdformat)
-        PsdPascalString(self.guid).write(fh)
+        fh.write(
+            b''.join(
+                (
+                    psdformat.pack(
+                        'IIhh', 1, self.imagemode.value, *self.point
+                    ),
+                    PsdUnicodeString(self.name).tobytes(psdformat),
+                    PsdPascalString(self.guid).tobytes(),
+                )
+            )
+        )
         if self.colortable is not None:
             assert self.imagemode == PsdImageMode.Indexed
             fh.write(self.colortable.tobytes())
@@ -1952,9 +2150,7 @@ class PsdPatterns(PsdKeyABC):
             raise ValueError('no channel data found')
         if len(datalist) == 1:
             return datalist[0]
-        data: NDArray[Any] = numpy.stack(datalist)
-        if not planar:
-            data = numpy.moveaxis(data, 0, -1)
+        data: NDArray[Any] = numpy.stack(datalist, axis=0 if planar else -1)
         return data
 
     def __repr__(self) -> str:
@@ -1996,18 +2192,23 @@ class PsdMetadataSettings(PsdKeyABC):
         length: int,
     ) -> PsdMetadataSettings:
         """Return metadata settings from open file."""
-        self = cls()
         count = psdformat.read(fh, 'I')
-        for _ in range(count):
-            self.items.append(PsdMetadataSetting.read(fh, psdformat))
-        return self
+        return cls(
+            items=[
+                PsdMetadataSetting.read(fh, psdformat) for _ in range(count)
+            ]
+        )
 
     def write(self, fh: BinaryIO, psdformat: PsdFormat, /) -> int:
         """Write metadata settings to open file."""
-        written = psdformat.write(fh, 'I', len(self.items))
-        for item in self.items:
-            written = item.write(fh, psdformat)
-        return written
+        return fh.write(
+            b''.join(
+                (
+                    psdformat.pack('I', len(self.items)),
+                    *(item.tobytes(psdformat) for item in self.items),
+                )
+            )
+        )
 
     def __repr__(self) -> str:
         sz = len(self.items)
@@ -2048,16 +2249,25 @@ class PsdMetadataSetting:
             signature=signature, key=key, data=data, copyonsheet=copyonsheet
         )
 
-    def write(self, fh: BinaryIO, psdformat: PsdFormat, /) -> int:
-        """Write metadata setting to open file."""
+    def tobytes(self, psdformat: PsdFormat, /) -> bytes:
+        """Return metadata setting record."""
         # TODO: can the format change?
         # psdformat.write_signature(fh, self.signature)
         # psdformat.write_key(fh, self.key)
-        fh.write(self.signature.value)
-        fh.write(self.key)
-        psdformat.write(fh, '?xxxI', self.copyonsheet, len(self.data))
-        fh.write(self.data)
-        return 16 + len(self.data)
+        return (
+            psdformat.pack(
+                '4s4s?xxxI',
+                self.signature.value,
+                self.key,
+                self.copyonsheet,
+                len(self.data),
+            )
+            + self.data
+        )
+
+    def write(self, fh: BinaryIO, psdformat: PsdFormat, /) -> int:
+        """Write metadata setting to open file."""
+        return fh.write(self.tobytes(psdformat))
 
     def __eq__(self, other: object) -> bool:
         return (
@@ -2083,7 +2293,7 @@ class PsdMetadataSetting:
         )
 
 
-@dataclasses.dataclass(repr=False)
+@dataclasses.dataclass(repr=False, slots=True)
 class PsdVirtualMemoryArrayList:
     """Virtual memory array list."""
 
@@ -2097,32 +2307,34 @@ class PsdVirtualMemoryArrayList:
         cls, fh: BinaryIO, psdformat: PsdFormat, /
     ) -> PsdVirtualMemoryArrayList:
         """Return instance from open file."""
-        version = psdformat.read(fh, 'I')
+        # version, length, rectangle, and channel count in one read
+        version, _, *rect, channelcount = psdformat.read(fh, 'II4II')
         assert version == 3
-        length = psdformat.read(fh, 'I')  # noqa
-        rectangle = PsdRectangle(*psdformat.read(fh, '4I'))
-        channelcount = psdformat.read(fh, 'I')
+        rectangle = PsdRectangle(*rect)
 
-        channels = []
-        for _ in range(channelcount + 2):
-            channels.append(PsdVirtualMemoryArray.read(fh, psdformat))
+        channels = [
+            PsdVirtualMemoryArray.read(fh, psdformat)
+            for _ in range(channelcount + 2)
+        ]
 
         return cls(rectangle=rectangle, channels=channels)
 
     def write(self, fh: BinaryIO, psdformat: PsdFormat, /) -> int:
         """Write virtual memory array list to open file."""
-        psdformat.write(fh, 'I', 3)
-        length_pos = fh.tell()
-        psdformat.write(fh, 'I', 0)  # length placeholder
-        pos = fh.tell()
-        psdformat.write(fh, '4I', *self.rectangle)
-        psdformat.write(fh, 'I', len(self.channels) - 2)
-        for channel in self.channels:
-            channel.write(fh, psdformat)
-        length = fh.tell() - pos
-        fh.seek(length_pos)
-        psdformat.write(fh, 'I', length)
-        fh.seek(length, 1)
+        records = [
+            record
+            for channel in self.channels
+            for record in channel._records(psdformat)
+        ]
+        length = sum(len(record) for record in records) + 20
+        # version, length, rectangle, and channel count in one pack
+        records.insert(
+            0,
+            psdformat.pack(
+                'II4II', 3, length, *self.rectangle, len(self.channels) - 2
+            ),
+        )
+        fh.writelines(records)
         return length + 8
 
     def __len__(self) -> int:
@@ -2147,7 +2359,7 @@ class PsdVirtualMemoryArrayList:
         )
 
 
-@dataclasses.dataclass(repr=False)
+@dataclasses.dataclass(repr=False, slots=True)
 class PsdVirtualMemoryArray:
     """Virtual memory array."""
 
@@ -2158,6 +2370,8 @@ class PsdVirtualMemoryArray:
     compression: PsdCompressionType = PsdCompressionType.RAW
     data: NDArray[Any] | None = None
 
+    TYPES = {8: 'B', 16: 'H', 32: 'f'}
+
     @classmethod
     def read(
         cls, fh: BinaryIO, psdformat: PsdFormat, /
@@ -2171,14 +2385,27 @@ class PsdVirtualMemoryArray:
         if length == 0:
             return cls(iswritten=iswritten)
 
-        depth = psdformat.read(fh, 'I')
-        rectangle = PsdRectangle(*psdformat.read(fh, '4I'))
-        pixeldepth = psdformat.read(fh, 'H')
-        compression = PsdCompressionType(psdformat.read(fh, 'B'))
-        dtype = {8: 'B', 16: 'H', 32: 'f'}[pixeldepth]
+        # depth, rectangle, pixel depth, compression, and data in one read
+        buffer: bytes | bytearray
+        readinto = getattr(fh, 'readinto', None)
+        if readinto is None:
+            # for example, mmap objects
+            buffer = fh.read(length)
+        else:
+            # read into writable buffer, which RAW data can be used from
+            buffer = bytearray(length)
+            size = readinto(buffer)
+            if size != length:
+                del buffer[size:]
+        depth, *rect, pixeldepth, compression = psdformat.unpack_from(
+            'I4IHB', buffer
+        )
+        rectangle = PsdRectangle(*rect)
+        compression = PsdCompressionType(compression)
+        dtype = PsdVirtualMemoryArray.TYPES[pixeldepth]
 
         data = decompress(
-            fh.read(length - 23),
+            memoryview(buffer)[23:],
             compression,
             rectangle.shape,
             dtype,
@@ -2196,10 +2423,18 @@ class PsdVirtualMemoryArray:
 
     def write(self, fh: BinaryIO, psdformat: PsdFormat, /) -> int:
         """Write virtual memory array to open file."""
-        start = fh.tell()
-        psdformat.write(fh, 'I', self.iswritten)
+        records = self._records(psdformat)
+        fh.writelines(records)
+        return sum(len(record) for record in records)
+
+    def tobytes(self, psdformat: PsdFormat, /) -> bytes:
+        """Return virtual memory array record."""
+        return b''.join(self._records(psdformat))
+
+    def _records(self, psdformat: PsdFormat, /) -> list[bytes | memoryview]:
+        """Return header and data buffers of virtual memory array record."""
         if not self.iswritten:
-            return fh.tell() - start
+            return [psdformat.pack('I', self.iswritten)]
 
         if (
             self.depth is None
@@ -2207,38 +2442,48 @@ class PsdVirtualMemoryArray:
             or self.pixeldepth is None
             or self.data is None
         ):
-            psdformat.write(fh, 'I', 0)
-            return fh.tell() - start
-
-        length_pos = fh.tell()
-        psdformat.write(fh, 'I', 0)  # length placeholder
-        pos = fh.tell()
+            return [psdformat.pack('II', self.iswritten, 0)]
 
-        psdformat.write(fh, 'I', self.depth)
-        psdformat.write(fh, '4I', *self.rectangle)
-        psdformat.write(fh, 'H', self.pixeldepth)
-        psdformat.write(fh, 'B', self.compression)
+        data: bytes | memoryview
+        if (
+            self.compression == PsdCompressionType.RAW
+            and self.data.dtype.char in 'BHf'
+        ):
+            # use buffer of big-endian, contiguous array instead of bytes copy
+            data = (
+                numpy.ascontiguousarray(
+                    self.data, self.data.dtype.newbyteorder('>')
+                )
+                .reshape(-1)
+                .view(numpy.uint8)
+                .data
+            )
+        else:
+            data = compress(
+                self.data,
+                self.compression,
+                psdformat.byteorder + 'H',
+            )
 
-        data = compress(
-            self.data,
+        # header including length of depth, rectangle, pixeldepth,
+        # compression, and data
+        header = psdformat.pack(
+            'III4IHB',
+            self.iswritten,
+            len(data) + 23,
+            self.depth,
+            *self.rectangle,
+            self.pixeldepth,
             self.compression,
-            psdformat.byteorder + 'H',
         )
-        fh.write(data)
-
-        length = fh.tell() - pos
-        fh.seek(length_pos)
-        psdformat.write(fh, 'I', length)
-        fh.seek(length, 1)
-
-        return fh.tell() - start
+        return [header, data]
 
     @property
     def dtype(self) -> numpy.dtype[Any]:
         """Data type of virtual memory array."""
         if self.pixeldepth is None:
             return numpy.dtype('B')
-        return numpy.dtype({8: 'B', 16: 'H', 32: 'f'}[self.pixeldepth])
+        return numpy.dtype(PsdVirtualMemoryArray.TYPES[self.pixeldepth])
 
     @property
     def shape(self) -> tuple[int, int]:
@@ -2260,9 +2505,7 @@ class PsdVirtualMemoryArray:
             and self.depth == other.depth
             and self.pixeldepth == other.pixeldepth
             and self.rectangle == other.rectangle
-            and numpy.array_equal(
-                self.data, other.data  # type: ignore[arg-type]
-            )
+            and array_equal(self.data, other.data)
             # and self.compression == other.compression
         )
 
@@ -2301,28 +2544,33 @@ class PsdSectionDividerSetting(PsdKeyABC):
         length: int,
     ) -> PsdSectionDividerSetting:
         """Return instance from open file."""
-        kind = PsdSectionDividerType(psdformat.read(fh, 'I'))
+        data = fh.read(min(length, 16))
+        kind = PsdSectionDividerType(psdformat.unpack_from('I', data))
         if length < 12:
             return cls(kind=kind)
-        signature = fh.read(4)
+        signature = data[4:8]
         assert signature in (b'8BIM', b'MIB8')
-        blendmode = PsdBlendMode(fh.read(4))
+        blendmode = PsdBlendMode(data[8:12])
         if length < 16:
             return cls(kind=kind, blendmode=blendmode)
-        subtype = psdformat.read(fh, 'I')
+        subtype = psdformat.unpack_from('I', data, 12)
         return cls(kind=kind, blendmode=blendmode, subtype=subtype)
 
     def write(self, fh: BinaryIO, psdformat: PsdFormat, /) -> int:
         """Write section divider setting to open file."""
-        psdformat.write(fh, 'I', self.kind.value)
         if self.blendmode is None:
-            return 4
-        psdformat.write_signature(fh, b'8BIM')
-        psdformat.write_signature(fh, self.blendmode.value)
-        if self.subtype is None:
-            return 12
-        psdformat.write(fh, 'I', self.subtype)
-        return 16
+            return psdformat.write(fh, 'I', self.kind.value)
+        # kind, signature, blend mode, and optional subtype in one pack
+        fmt = 'I4s4s'
+        values = [
+            self.kind.value,
+            psdformat.pack_signature(b'8BIM'),
+            psdformat.pack_signature(self.blendmode.value),
+        ]
+        if self.subtype is not None:
+            fmt += 'I'
+            values.append(self.subtype)
+        return psdformat.write(fh, fmt, *values)
 
     def __repr__(self) -> str:
         return indent(
@@ -2453,9 +2701,7 @@ class PsdTextEngineData(PsdKeyABC):
 
     def write(self, fh: BinaryIO, psdformat: PsdFormat, /) -> int:
         """Write unicode string to open file."""
-        written = psdformat.write(fh, 'I', len(self.data))
-        written += fh.write(self.data)
-        return written
+        return fh.write(psdformat.pack('I', len(self.data)) + self.data)
 
     def __repr__(self) -> str:
         if len(self.data) <= REPR_MAXLEN:
@@ -2467,7 +2713,7 @@ class PsdTextEngineData(PsdKeyABC):
         )
 
 
-@dataclasses.dataclass(repr=False)
+@dataclasses.dataclass(repr=False, slots=True)
 class PsdString(PsdKeyABC):
     """Unicode string."""
 
@@ -2502,7 +2748,7 @@ class PsdString(PsdKeyABC):
         )
 
 
-@dataclasses.dataclass(repr=False)
+@dataclasses.dataclass(repr=False, slots=True)
 class PsdBoolean(PsdKeyABC):
     """Boolean."""
 
@@ -2519,8 +2765,7 @@ class PsdBoolean(PsdKeyABC):
         length: int,
     ) -> PsdBoolean:
         """Return instance from open file."""
-        value = bool(fh.read(1)[0])
-        fh.read(3)
+        value = fh.read(4)[0] != 0
         return cls(key=key, value=value)
 
     def write(self, fh: BinaryIO, psdformat: PsdFormat, /) -> int:
@@ -2534,7 +2779,7 @@ class PsdBoolean(PsdKeyABC):
         return f'{self.__class__.__name__}({enumstr(self.key)}, {self.value})'
 
 
-@dataclasses.dataclass(repr=False)
+@dataclasses.dataclass(repr=False, slots=True)
 class PsdInteger(PsdKeyABC):
     """4 Byte Integer."""
 
@@ -2562,7 +2807,7 @@ class PsdInteger(PsdKeyABC):
         return f'{self.__class__.__name__}({enumstr(self.key)}, {self.value})'
 
 
-@dataclasses.dataclass(repr=False)
+@dataclasses.dataclass(repr=False, slots=True)
 class PsdWord(PsdKeyABC):
     """Four bytes."""
 
@@ -2591,7 +2836,7 @@ class PsdWord(PsdKeyABC):
         )
 
 
-@dataclasses.dataclass(repr=False)
+@dataclasses.dataclass(repr=False, slots=True)
 class PsdUnknown(PsdKeyABC):
     """Unknown keys stored as opaque bytes."""
 
@@ -2652,7 +2897,7 @@ class PsdUnknown(PsdKeyABC):
         )
 
 
-@dataclasses.dataclass(repr=False)
+@dataclasses.dataclass(repr=False, slots=True)
 class PsdEmpty(PsdKeyABC):
     """Empty structure, no data associated with key."""
 
@@ -2694,6 +2939,8 @@ class PsdEmpty(PsdKeyABC):
 class PsdResourceBlockABC(metaclass=abc.ABCMeta):
     """Abstract base class for image resource block data."""
 
+    __slots__ = ()
+
     resourceid: PsdResourceId
     name: str
 
@@ -2744,7 +2991,7 @@ class PsdResourceBlockABC(metaclass=abc.ABCMeta):
         )
 
 
-@dataclasses.dataclass(repr=False)
+@dataclasses.dataclass(repr=False, slots=True)
 class PsdBytesBlock(PsdResourceBlockABC):
     """Image resource blocks stored as opaque bytes."""
 
@@ -2770,6 +3017,10 @@ class PsdBytesBlock(PsdResourceBlockABC):
         """Write instance values to open file."""
         return fh.write(self.value)
 
+    def tobytes(self, psdformat: PsdFormat, /) -> bytes:
+        """Return instance values as bytes."""
+        return self.value
+
     def __repr__(self) -> str:
         if len(self.value) > REPR_MAXLEN:
             value = f'value=...,  # bytes({len(self.value)})'
@@ -2807,8 +3058,7 @@ class PsdVersionBlock(PsdResourceBlockABC):
         length: int,
     ) -> PsdVersionBlock:
         """Return instance from open file."""
-        version = psdformat.read(fh, 'I')
-        has_real_merged_data = bool(fh.read(1)[0])
+        version, has_real_merged_data = psdformat.read(fh, 'I?')
         writer_name = str(PsdUnicodeString.read(fh, psdformat))
         reader_name = str(PsdUnicodeString.read(fh, psdformat))
         file_version = psdformat.read(fh, 'I')
@@ -2824,13 +3074,18 @@ class PsdVersionBlock(PsdResourceBlockABC):
 
     def write(self, fh: BinaryIO, psdformat: PsdFormat, /) -> int:
         """Write instance values to open file."""
-        written = 0
-        written += psdformat.write(fh, 'I', self.version)
-        written += fh.write(b'\1' if self.has_real_merged_data else b'\0')
-        written += PsdUnicodeString(self.writer_name).write(fh, psdformat)
-        written += PsdUnicodeString(self.reader_name).write(fh, psdformat)
-        written += psdformat.write(fh, 'I', self.file_version)
-        return written
+        return fh.write(self.tobytes(psdformat))
+
+    def tobytes(self, psdformat: PsdFormat, /) -> bytes:
+        """Return instance values as bytes."""
+        return b''.join(
+            (
+                psdformat.pack('I?', self.version, self.has_real_merged_data),
+                PsdUnicodeString(self.writer_name).tobytes(psdformat),
+                PsdUnicodeString(self.reader_name).tobytes(psdformat),
+                psdformat.pack('I', self.file_version),
+            )
+        )
 
     def __repr__(self) -> str:
         return indent(
@@ -2846,7 +3101,7 @@ class PsdVersionBlock(PsdResourceBlockABC):
         )
 
 
-@dataclasses.dataclass(repr=False)
+@dataclasses.dataclass(repr=False, slots=True)
 class PsdStringBlock(PsdResourceBlockABC):
     """Unicode string."""
 
@@ -2872,6 +3127,10 @@ class PsdStringBlock(PsdResourceBlockABC):
         """Write Pascal string to open file."""
         return PsdUnicodeString(self.value).write(fh, psdformat)
 
+    def tobytes(self, psdformat: PsdFormat, /) -> bytes:
+        """Return Unicode string as bytes."""
+        return PsdUnicodeString(self.value).tobytes(psdformat)
+
     def __repr__(self) -> str:
         return indent(
             f'{self.__class__.__name__}(',
@@ -2882,7 +3141,7 @@ class PsdStringBlock(PsdResourceBlockABC):
         )
 
 
-@dataclasses.dataclass(repr=False)
+@dataclasses.dataclass(repr=False, slots=True)
 class PsdStringsBlock(PsdResourceBlockABC):
     """Series of Unicode strings."""
 
@@ -2901,18 +3160,33 @@ class PsdStringsBlock(PsdResourceBlockABC):
         length: int,
     ) -> PsdStringsBlock:
         """Return instance from open file."""
+        data = fh.read(length)
         values = []
-        pos = fh.tell()
-        while fh.tell() - pos < length:
-            values.append(str(PsdUnicodeString.read(fh, psdformat)))
+        offset = 0
+        while offset + 4 <= len(data):
+            size = psdformat.unpack_from('I', data, offset) * 2
+            offset += 4
+            if offset + size > len(data):
+                raise OSError(
+                    f'could not read enough data, {len(data) - offset} '
+                    f'!= {size}'
+                )
+            value = data[offset : offset + size].decode(psdformat.utf16)
+            if value and value[-1] == '\0':
+                value = value[:-1]
+            values.append(value)
+            offset += size
         return cls(resourceid=resourceid, name=name, values=values)
 
     def write(self, fh: BinaryIO, psdformat: PsdFormat, /) -> int:
         """Write sequence of Unicode strings to open file."""
-        written = 0
-        for value in self.values:
-            written += PsdUnicodeString(value).write(fh, psdformat)
-        return written
+        return fh.write(self.tobytes(psdformat))
+
+    def tobytes(self, psdformat: PsdFormat, /) -> bytes:
+        """Return sequence of Unicode strings as bytes."""
+        return b''.join(
+            PsdUnicodeString(value).tobytes(psdformat) for value in self.values
+        )
 
     def __repr__(self) -> str:
         values = tuple(f"'{v}'" for v in self.values)
@@ -2926,7 +3200,7 @@ class PsdStringsBlock(PsdResourceBlockABC):
         )
 
 
-@dataclasses.dataclass(repr=False)
+@dataclasses.dataclass(repr=False, slots=True)
 class PsdPascalStringBlock(PsdResourceBlockABC):
     """Pascal string."""
 
@@ -2952,6 +3226,10 @@ class PsdPascalStringBlock(PsdResourceBlockABC):
         """Write Pascal string to open file."""
         return PsdPascalString(self.value).write(fh, pad=2)
 
+    def tobytes(self, psdformat: PsdFormat, /) -> bytes:
+        """Return Pascal string as bytes."""
+        return PsdPascalString(self.value).tobytes(pad=2)
+
     def __repr__(self) -> str:
         return indent(
             f'{self.__class__.__name__}(',
@@ -2962,7 +3240,7 @@ class PsdPascalStringBlock(PsdResourceBlockABC):
         )
 
 
-@dataclasses.dataclass(repr=False)
+@dataclasses.dataclass(repr=False, slots=True)
 class PsdPascalStringsBlock(PsdResourceBlockABC):
     """Series of Pascal strings."""
 
@@ -2981,18 +3259,30 @@ class PsdPascalStringsBlock(PsdResourceBlockABC):
         length: int,
     ) -> PsdPascalStringsBlock:
         """Return instance from open file."""
+        data = fh.read(length)
         values = []
-        pos = fh.tell()
-        while fh.tell() - pos < length:
-            values.append(str(PsdPascalString.read(fh, pad=1)))
+        offset = 0
+        while offset < len(data):
+            size = data[offset]
+            offset += 1
+            if offset + size > len(data):
+                raise OSError(
+                    f'could not read enough data, {len(data) - offset} '
+                    f'!= {size}'
+                )
+            values.append(data[offset : offset + size].decode('macroman'))
+            offset += size
         return cls(resourceid=resourceid, name=name, values=values)
 
     def write(self, fh: BinaryIO, psdformat: PsdFormat, /) -> int:
         """Write sequence of Pascal strings to open file."""
-        written = 0
-        for value in self.values:
-            written += PsdPascalString(value).write(fh, pad=1)
-        return written
+        return fh.write(self.tobytes(psdformat))
+
+    def tobytes(self, psdformat: PsdFormat, /) -> bytes:
+        """Return sequence of Pascal strings as bytes."""
+        return b''.join(
+            PsdPascalString(value).tobytes(pad=1) for value in self.values
+        )
 
     def __repr__(self) -> str:
         values = tuple(f"'{v}'" for v in self.values)
@@ -3006,7 +3296,7 @@ class PsdPascalStringsBlock(PsdResourceBlockABC):
         )
 
 
-@dataclasses.dataclass(repr=False)
+@dataclasses.dataclass(repr=False, slots=True)
 class PsdColorBlock(PsdResourceBlockABC):
     """Color structure."""
 
@@ -3026,9 +3316,10 @@ class PsdColorBlock(PsdResourceBlockABC):
         length: int,
     ) -> PsdColorBlock:
         """Return instance from open file."""
-        colorspace = PsdColorSpaceType(psdformat.read(fh, 'h'))
+        data = fh.read(10)
+        colorspace = PsdColorSpaceType(psdformat.unpack_from('h', data))
         fmt = '4h' if colorspace == PsdColorSpaceType.Lab else '4H'
-        components = psdformat.read(fh, fmt)
+        components = psdformat.unpack_from(fmt, data, 2)
         return cls(
             resourceid=resourceid,
             name=name,
@@ -3038,8 +3329,12 @@ class PsdColorBlock(PsdResourceBlockABC):
 
     def write(self, fh: BinaryIO, psdformat: PsdFormat, /) -> int:
         """Write instance values to open file."""
+        return fh.write(self.tobytes(psdformat))
+
+    def tobytes(self, psdformat: PsdFormat, /) -> bytes:
+        """Return instance values as bytes."""
         fmt = 'h4h' if self.colorspace == PsdColorSpaceType.Lab else 'h4H'
-        return psdformat.write(fh, fmt, self.colorspace, *self.components)
+        return psdformat.pack(fmt, self.colorspace, *self.components)
 
     def __repr__(self) -> str:
         return indent(
@@ -3127,21 +3422,32 @@ class PsdThumbnailBlock(PsdResourceBlockABC):
         """Thumbnail image is BGR."""
         return self.resourceid.value == 1033
 
-    @property
+    @cached_property
     def data(self) -> NDArray[Any]:
-        """Thumbnail image array."""
+        """Thumbnail image array.
+
+        The image is decoded once and cached.
+
+        """
         if self.format == PsdThumbnailFormat.RAW_RGB:
-            data = numpy.frombuffer(self.rawdata, dtype=numpy.uint8)
-            data.shape = (self.height, (self.width * 24 + 31) // 32 * 4)
-            data = data[:, : self.width * 3]
-            data = data.reshape(self.height, self.width, 3)
+            # strided view of padded rows, copied once if rows are padded
+            data = numpy.ascontiguousarray(
+                numpy.ndarray(
+                    (self.height, self.width, 3),
+                    dtype=numpy.uint8,
+                    buffer=self.rawdata,
+                    strides=((self.width * 24 + 31) // 32 * 4, 3, 1),
+                )
+            )
         elif self.format == PsdThumbnailFormat.JPEG_RGB:
             from imagecodecs import jpeg8_decode
 
             data = jpeg8_decode(self.rawdata)
             assert data.shape == (self.height, self.width, 3)
         else:
-            raise ValueError(f'unknown PsdThumbnailBlock format {format!r}')
+            raise ValueError(
+                f'unknown PsdThumbnailBlock format {self.format!r}'
+            )
         return data
 
     @property
@@ -3176,7 +3482,12 @@ class TiffImageSourceData:
 
     @classmethod
     def read(
-        cls, fh: BinaryIO, /, name: str | None = None, unknown: bool = True
+        cls,
+        fh: BinaryIO,
+        /,
+        name: str | None = None,
+        unknown: bool = True,
+        maxworkers: int = 1,
     ) -> TiffImageSourceData:
         """Return instance from open file."""
         name = type(fh).__name__ if name is None else name
@@ -3200,31 +3511,44 @@ class TiffImageSourceData:
         usermask = None
         info: list[PsdKeyABC] = []
 
-        while fh.read(4) == psdformat:
-            key = PsdKey(fh.read(4))
-            size = psdformat.read_size(fh, key)
+        # dispatch tables bound outside of loop
+        read_header = psdformat.read_header
+        tagtypes = PSD_KEY_TYPE.get
+        layertypes = PsdLayers.TYPES
+        while True:
+            header = read_header(fh)
+            if header is None:
+                break
+            key, size = header
             pos = fh.tell()
+            tagtype = tagtypes(key)
 
             if size == 0:
                 info.append(PsdEmpty(key))
-            elif key in PsdLayers.TYPES and layers is None:
+            elif key in layertypes and layers is None:
                 layers = PsdLayers.read(
-                    fh, psdformat, key, length=size, unknown=unknown
+                    fh,
+                    psdformat,
+                    key,
+                    length=size,
+                    unknown=unknown,
+                    maxworkers=maxworkers,
                 )
             elif key == PsdKey.USER_MASK and usermask is None:
                 usermask = PsdUserMask.read(fh, psdformat, key, length=size)
-            elif key in PSD_KEY_TYPE:
-                info.append(
-                    PSD_KEY_TYPE[key].read(fh, psdformat, key, length=size)
-                )
+            elif tagtype is not None:
+                info.append(tagtype.read(fh, psdformat, key, length=size))
             elif unknown:
                 info.append(PsdUnknown.read(fh, psdformat, key, length=size))
                 # logger().warning(
                 #     f"<TiffImageSourceData '{name}'> skipped {size} bytes "
                 #     f"in {key.value.decode()!r} info"
                 # )
-            size += (4 - size % 4) % 4
+            # sections are aligned to 4 bytes; skip padding by reading,
+            # which does not fail if padding is missing at end of data
             fh.seek(pos + size)
+            if size & 3:
+                fh.read(-size & 3)
 
         if layers is None:
             logger().warning(f'<{cls.__name__} {name!r}> contains no layers')
@@ -3244,11 +3568,18 @@ class TiffImageSourceData:
 
     @classmethod
     def frombytes(
-        cls, data: bytes, /, name: str | None = None, unknown: bool = True
+        cls,
+        data: bytes,
+        /,
+        name: str | None = None,
+        unknown: bool = True,
+        maxworkers: int = 1,
     ) -> TiffImageSourceData:
         """Return instance from bytes."""
         with io.BytesIO(data) as fh:
-            self = cls.read(fh, name=name, unknown=unknown)
+            self = cls.read(
+                fh, name=name, unknown=unknown, maxworkers=maxworkers
+            )
         return self
 
     @classmethod
@@ -3258,14 +3589,16 @@ class TiffImageSourceData:
         /,
         pageindex: int = 0,
         unknown: bool = True,
+        maxworkers: int = 1,
     ) -> TiffImageSourceData:
         """Return instance from TIFF file."""
-        data = read_tifftag(filename, 37724, pageindex=pageindex)
-        if data is None:
-            raise ValueError('TIFF file contains no ImageSourceData tag')
-        return cls.frombytes(
-            data, name=os.path.split(filename)[-1], unknown=unknown
-        )
+        with mmap_tifftag(filename, 37724, pageindex=pageindex) as (fh, _):
+            return cls.read(
+                fh,
+                name=os.path.split(filename)[-1],
+                unknown=unknown,
+                maxworkers=maxworkers,
+            )
 
     def write(
         self,
@@ -3277,6 +3610,21 @@ class TiffImageSourceData:
         maxworkers: int = 1,
     ) -> int:
         """Write ImageResourceData tag value to open file."""
+        if isinstance(fh, io.RawIOBase):
+            # buffer the many small writes to unbuffered files
+            buffered = io.BufferedWriter(fh, buffer_size=1048576)
+            try:
+                return self.write(
+                    cast('BinaryIO', buffered),
+                    psdformat,
+                    compression=compression,
+                    unknown=unknown,
+                    maxworkers=maxworkers,
+                )
+            finally:
+                buffered.flush()
+                buffered.detach()
+
         psdformat = (
             self.psdformat if psdformat is None else PsdFormat(psdformat)
         )
@@ -3401,10 +3749,8 @@ class TiffImageResources:
         cls, filename: os.PathLike[Any] | str, /, pageindex: int = 0
     ) -> TiffImageResources:
         """Return instance from ImageResources tag in TIFF file."""
-        data = read_tifftag(filename, 34377, pageindex=pageindex)
-        if data is None:
-            raise ValueError('TIFF file contains no ImageResources tag')
-        return cls.frombytes(data, name=os.path.split(filename)[-1])
+        with mmap_tifftag(filename, 34377, pageindex=pageindex) as (fh, size):
+            return cls.read(fh, length=size, name=os.path.split(filename)[-1])
 
     def write(self, fh: BinaryIO) -> int:
         """Write ImageResources tag value to open file."""
@@ -3441,9 +3787,18 @@ class TiffImageResources:
         return blocks_dict
 
     def __eq__(self, other: object) -> bool:
-        return (
-            isinstance(other, self.__class__)
-            and self.tobytes() == other.tobytes()
+        if not isinstance(other, self.__class__):
+            return False
+        if len(self.blocks) != len(other.blocks):
+            return False
+        # compare block by block and stop at first difference;
+        # serialize only blocks whose fields differ
+        psdformat = PsdFormat.BE32BIT
+        return all(
+            a.resourceid.value == b.resourceid.value
+            and a.name == b.name
+            and (a == b or a.tobytes(psdformat) == b.tobytes(psdformat))
+            for a, b in zip(self.blocks, other.blocks)
         )
 
     def __contains__(self, key: int) -> bool:
@@ -3472,23 +3827,25 @@ class TiffImageResources:
         )
 
 
-PSD_KEY_64BIT = {
-    # if 64 bit format, these keys use a length count of 8 bytes
-    PsdKey.ALPHA,
-    PsdKey.FILTER_MASK,
-    PsdKey.USER_MASK,
-    PsdKey.LAYER,
-    PsdKey.LAYER_16,
-    PsdKey.LAYER_32,
-    PsdKey.SAVING_MERGED_TRANSPARENCY,
-    PsdKey.SAVING_MERGED_TRANSPARENCY2,
-    PsdKey.SAVING_MERGED_TRANSPARENCY_16,
-    PsdKey.SAVING_MERGED_TRANSPARENCY_32,
-    PsdKey.LINKED_LAYER_2,
-    PsdKey.FILTER_EFFECTS,
-    PsdKey.FILTER_EFFECTS_2,
-    PsdKey.PIXEL_SOURCE_DATA_CC15,
-}
+PSD_KEY_64BIT = frozenset(
+    {
+        # if 64 bit format, these keys use a length count of 8 bytes
+        PsdKey.ALPHA,
+        PsdKey.FILTER_MASK,
+        PsdKey.USER_MASK,
+        PsdKey.LAYER,
+        PsdKey.LAYER_16,
+        PsdKey.LAYER_32,
+        PsdKey.SAVING_MERGED_TRANSPARENCY,
+        PsdKey.SAVING_MERGED_TRANSPARENCY2,
+        PsdKey.SAVING_MERGED_TRANSPARENCY_16,
+        PsdKey.SAVING_MERGED_TRANSPARENCY_32,
+        PsdKey.LINKED_LAYER_2,
+        PsdKey.FILTER_EFFECTS,
+        PsdKey.FILTER_EFFECTS_2,
+        PsdKey.PIXEL_SOURCE_DATA_CC15,
+    }
+)
 
 PSD_KEY_TYPE: dict[PsdKey, type[PsdKeyABC]] = {
     PsdKey.BLEND_CLIPPING_ELEMENTS: PsdBoolean,
@@ -3600,20 +3957,40 @@ def read_psdblocks(fh: BinaryIO, /, length: int) -> list[PsdResourceBlockABC]:
     align = 2
     psdformat = PsdFormat.BE32BIT
     blocks: list[PsdResourceBlockABC] = []
-    end = fh.tell() + length
-    while fh.tell() < end and fh.read(4) == psdformat:
-        resourceid = PsdResourceId(psdformat.read(fh, 'H'))
-        name = str(PsdPascalString.read(fh, 2))
-        size = psdformat.read(fh, 'I')
-        pos = fh.tell()
-        resourcetype = PSD_RESOURCE_TYPE.get(resourceid, PsdBytesBlock)
+    # track file position instead of calling tell in every iteration
+    pos = fh.tell()
+    end = pos + length
+    # methods bound outside of loop
+    resourcetypes = PSD_RESOURCE_TYPE.get
+    read = fh.read
+    seek = fh.seek
+    unpack_from = psdformat.unpack_from
+    while pos < end:
+        # signature, resource id, and length of name in one read
+        header = read(7)
+        if len(header) != 7 or header[:4] != psdformat:
+            break
+        resourceid = PsdResourceId(unpack_from('H', header, 4))
+        # name, padding to even length, and size in one read
+        namesize = header[6]
+        offset = namesize + (~namesize & 1)
+        data = read(offset + 4)
+        if len(data) != offset + 4:
+            raise OSError(
+                f'could not read enough data, {len(data)} != {offset + 4}'
+            )
+        name = data[:namesize].decode('macroman')
+        size = unpack_from('I', data, offset)
+        pos += offset + 11
+        resourcetype = resourcetypes(resourceid, PsdBytesBlock)
         blocks.append(
             resourcetype.read(
                 fh, psdformat, resourceid, name=name, length=size
             )
         )
-        size += (align - size % align) % align
-        fh.seek(pos + size)
+        pos += (size + align - 1) & -align
+        # padding may be missing at end of data
+        seek(min(pos, end))
     return blocks
 
 
@@ -3622,19 +3999,27 @@ def write_psdblocks(fh: BinaryIO, /, *blocks: PsdResourceBlockABC) -> int:
     align = 2
     psdformat = PsdFormat.BE32BIT
     start = fh.tell()
+    # methods bound outside of loop
+    write = fh.write
+    pack = psdformat.pack
     for block in blocks:
-        fh.write(psdformat.value)
-        psdformat.write(fh, 'H', block.resourceid.value)
-        PsdPascalString(block.name).write(fh, 2)
-        size_pos = fh.tell()
-        psdformat.write(fh, 'I', 0)  # update later
-        pos = fh.tell()
-        block.write(fh, psdformat)
-        size = fh.tell() - pos
-        fh.seek(size_pos)
-        psdformat.write(fh, 'I', size)
-        fh.seek(size, 1)
-        fh.write(b'\0' * ((align - size % align) % align))
+        # serialize block first to write size without seeking back
+        data = block.tobytes(psdformat)
+        size = len(data)
+        write(
+            b''.join(
+                (
+                    psdformat.value,
+                    pack('H', block.resourceid.value),
+                    PsdPascalString(block.name).tobytes(2),
+                    pack('I', size),
+                )
+            )
+        )
+        write(data)
+        pad = -size & (align - 1)
+        if pad:
+            write(b'\0' * pad)
     return fh.tell() - start
 
 
@@ -3648,21 +4033,28 @@ def read_psdtags(
 ) -> list[PsdKeyABC]:
     """Return list of tags from open file."""
     tags: list[PsdKeyABC] = []
-    end = fh.tell() + length
-    while fh.tell() < end and fh.read(4) == psdformat:
-        key = PsdKey(fh.read(4))
-        size = psdformat.read_size(fh, key)
-        pos = fh.tell()
+    pos = fh.tell()
+    end = pos + length
+    read_header = psdformat.read_header
+    tagtypes = PSD_KEY_TYPE.get
+    tell = fh.tell
+    seek = fh.seek
+    while pos < end:
+        header = read_header(fh)
+        if header is None:
+            break
+        key, size = header
+        pos = tell()
+        tagtype = tagtypes(key)
         if size == 0:
             tags.append(PsdEmpty(key))
-        elif key in PSD_KEY_TYPE:
-            tags.append(
-                PSD_KEY_TYPE[key].read(fh, psdformat, key, length=size)
-            )
+        elif tagtype is not None:
+            tags.append(tagtype.read(fh, psdformat, key, length=size))
         elif unknown:
             tags.append(PsdUnknown.read(fh, psdformat, key, length=size))
-        size += (align - size % align) % align
-        fh.seek(pos + size)
+        # align is a power of two
+        pos += (size + align - 1) & -align
+        seek(pos)
     return tags
 
 
@@ -3690,12 +4082,13 @@ def write_psdtags(
                     f'<PsdUnknown {tag.key.value.decode()!r}> not written'
                 )
                 continue
-        fh.write(psdformat.value)
-        psdformat.write_key(fh, tag.key)
-        size_pos = fh.tell()
-        psdformat.write_size(fh, 0, tag.key)
-        pos = fh.tell()
         if isinstance(tag, PsdLayers):
+            # layers can be large; write in place and update size later
+            fh.write(psdformat.value)
+            psdformat.write_key(fh, tag.key)
+            size_pos = fh.tell()
+            psdformat.write_size(fh, 0, tag.key)
+            pos = fh.tell()
             tag.write(
                 fh,
                 psdformat,
@@ -3703,13 +4096,27 @@ def write_psdtags(
                 unknown=unknown,
                 maxworkers=maxworkers,
             )
+            size = fh.tell() - pos
+            fh.seek(size_pos)
+            psdformat.write_size(fh, size, tag.key)
+            fh.seek(size, 1)
         else:
-            tag.write(fh, psdformat)
-        size = fh.tell() - pos
-        fh.seek(size_pos)
-        psdformat.write_size(fh, size, tag.key)
-        fh.seek(size, 1)
-        fh.write(b'\0' * ((align - size % align) % align))
+            # serialize tag first to write size without seeking back
+            data = tag.tobytes(psdformat)
+            size = len(data)
+            fh.write(
+                b''.join(
+                    (
+                        psdformat.value,
+                        psdformat.pack_key(tag.key),
+                        psdformat.pack_size(size, tag.key),
+                    )
+                )
+            )
+            fh.write(data)
+        pad = -size & (align - 1)
+        if pad:
+            fh.write(b'\0' * pad)
 
     return fh.tell() - start
 
@@ -3727,11 +4134,51 @@ def read_tifftag(
     return data
 
 
+@contextmanager
+def mmap_tifftag(
+    filename: os.PathLike[Any] | str, tag: int, /, pageindex: int = 0
+) -> Iterator[tuple[BinaryIO, int]]:
+    """Return memory-mapped tag value and its size from TIFF file.
+
+    The file is positioned at the start of the tag value and ends with it.
+
+    """
+    from tifffile import TIFF, TiffFile
+
+    with TiffFile(filename) as tif:
+        tiftag = tif.pages[pageindex].aspage().tags.get(tag)
+        if tiftag is None:
+            raise ValueError(
+                f'TIFF file contains no {TIFF.TAGS.get(tag, str(tag))} tag'
+            )
+        offset = tiftag.valueoffset
+        size = tiftag.valuebytecount
+    if size == 0:
+        with io.BytesIO() as empty:
+            yield cast('BinaryIO', empty), 0
+        return
+    start = offset - offset % mmap.ALLOCATIONGRANULARITY
+    with (
+        open(filename, 'rb') as fh,
+        mmap.mmap(
+            fh.fileno(),
+            offset + size - start,
+            access=mmap.ACCESS_READ,
+            offset=start,
+        ) as mm,
+    ):
+        if hasattr(mmap, 'MADV_SEQUENTIAL'):
+            # tag value is parsed front to back
+            mm.madvise(mmap.MADV_SEQUENTIAL)
+        mm.seek(offset - start)
+        yield cast('BinaryIO', mm), size
+
+
 def compress(
     data: NDArray[Any], compression: PsdCompressionType, rlecountfmt: str
 ) -> bytes:
     """Return compressed big-endian numpy array."""
-    data = data.astype(data.dtype.newbyteorder('>'))
+    data = data.astype(data.dtype.newbyteorder('>'), copy=False)
     if data.dtype.char not in 'BHf':
         raise ValueError(f'data type {data.dtype!r} not supported')
 
@@ -3742,7 +4189,7 @@ def compress(
         return data.tobytes()
 
     if compression == PsdCompressionType.ZIP:
-        return zlib.compress(data.tobytes())
+        return zlib_encode(numpy.ascontiguousarray(data).data)
 
     if compression == PsdCompressionType.ZIP_PREDICTED:
         import imagecodecs
@@ -3751,21 +4198,39 @@ def compress(
             data = imagecodecs.floatpred_encode(data)
         else:
             data = imagecodecs.delta_encode(data)
-        return zlib.compress(data.tobytes())
+        return zlib_encode(numpy.ascontiguousarray(data).data)
 
     if compression == PsdCompressionType.RLE:
         import imagecodecs
 
-        lines = [imagecodecs.packbits_encode(line) for line in data]
-        sizes = [len(line) for line in lines]
-        fmt = f'{rlecountfmt[0]}{len(sizes)}{rlecountfmt[1]}'
-        return struct.pack(fmt, *sizes) + b''.join(lines)
+        # the byte counts of all lines are required, which packbits_encode
+        # with axis argument does not return
+        lines = list(map(imagecodecs.packbits_encode, data))
+        sizes = numpy.fromiter(
+            map(len, lines), dtype=rlecountfmt, count=len(lines)
+        )
+        return b''.join((sizes.tobytes(), *lines))
 
     raise ValueError(f'unknown compression type {compression!r}')
 
 
+def zlib_encode(data: bytes | memoryview, /) -> bytes:
+    """Return zlib stream of data.
+
+    Use libdeflate via imagecodecs if available, which is faster than zlib.
+
+    """
+    try:
+        from imagecodecs import deflate_encode
+
+        # buffers are accepted; bytes are returned if out is not specified
+        return cast(bytes, deflate_encode(cast(bytes, data)))
+    except ImportError:
+        return zlib.compress(data)
+
+
 def decompress(
-    data: bytes,
+    data: bytes | memoryview,
     compression: PsdCompressionType,
     shape: tuple[int, ...],
     dtype: DTypeLike,
@@ -3776,33 +4241,80 @@ def decompress(
     if dtype.char not in 'BHf':
         raise ValueError(f'data type {dtype!r} not supported')
 
-    uncompressed_size = product(shape) * dtype.itemsize
+    uncompressed_size = math.prod(shape) * dtype.itemsize
     if uncompressed_size == 0:
         return numpy.zeros(shape, dtype=dtype)
 
     if compression == PsdCompressionType.RAW:
-        return numpy.frombuffer(data, dtype=dtype).reshape(shape).copy()
+        image = numpy.frombuffer(data, dtype=dtype).reshape(shape)
+        if not image.flags.writeable:
+            image = image.copy()
+        return image
 
     if compression == PsdCompressionType.ZIP:
-        # this fails to decompress zlib streams written by Krita
-        data = zlib.decompress(data, bufsize=uncompressed_size)
-        return numpy.frombuffer(data, dtype=dtype).reshape(shape).copy()
+        try:
+            from imagecodecs import zlib_decode
+        except ImportError:
+            # this fails to decompress zlib streams written by Krita
+            data = zlib.decompress(data, bufsize=uncompressed_size)
+            return numpy.frombuffer(data, dtype=dtype).reshape(shape).copy()
+        # decompress directly into output array
+        image = numpy.empty(shape, dtype=dtype)
+        try:
+            out = zlib_decode(
+                cast(bytes, data),
+                out=image.reshape(-1).view(numpy.uint8).data,
+            )
+        except Exception as exc:
+            raise ValueError(f'ZIP decompression failed: {exc}') from exc
+        if len(out) != uncompressed_size:
+            raise ValueError(
+                f'decompressed size {len(out)} != {uncompressed_size}'
+            )
+        return image
 
     if compression == PsdCompressionType.ZIP_PREDICTED:
         import imagecodecs
 
-        data = imagecodecs.zlib_decode(data, out=uncompressed_size)
-        image = numpy.frombuffer(data, dtype=dtype).reshape(shape)
+        # decompress into output array and undo delta encoding in-place
+        image = numpy.empty(shape, dtype=dtype)
+        try:
+            out = imagecodecs.zlib_decode(
+                cast(bytes, data),
+                out=image.reshape(-1).view(numpy.uint8).data,
+            )
+        except Exception as exc:
+            raise ValueError(f'ZIP decompression failed: {exc}') from exc
+        if len(out) != uncompressed_size:
+            raise ValueError(
+                f'decompressed size {len(out)} != {uncompressed_size}'
+            )
         if dtype.kind == 'f':
             return imagecodecs.floatpred_decode(image)
-        return imagecodecs.delta_decode(image)
+        return imagecodecs.delta_decode(image, out=image)
 
     if compression == PsdCompressionType.RLE:
         import imagecodecs
 
-        offset = shape[0] * struct.calcsize(rlecountfmt)
-        data = imagecodecs.packbits_decode(data[offset:])
-        return numpy.frombuffer(data, dtype=dtype).reshape(shape).copy()
+        # byte counts of compressed lines
+        counts = numpy.frombuffer(data, dtype=rlecountfmt, count=shape[0])
+        offset = counts.nbytes
+        size = offset + int(counts.sum(dtype=numpy.int64))
+        if size > len(data):
+            raise ValueError(f'RLE data size {len(data)} < {size}')
+        # decode into writable buffer and return view without copying
+        try:
+            out = imagecodecs.packbits_decode(
+                cast(bytes, memoryview(data)[offset:size]),
+                out=bytearray(uncompressed_size),
+            )
+        except Exception as exc:
+            raise ValueError(f'RLE decompression failed: {exc}') from exc
+        if len(out) != uncompressed_size:
+            raise ValueError(
+                f'decompressed size {len(out)} != {uncompressed_size}'
+            )
+        return numpy.frombuffer(out, dtype=dtype).reshape(shape)
 
     raise ValueError(f'unknown compression type {compression!r}')
 
@@ -3862,10 +4374,13 @@ def overlay(
             slice(offset[0], offset[0] + a.shape[0]),
             slice(offset[1], offset[1] + a.shape[1]),
         ]
-        x = b[..., 3:] * (1.0 - a[..., 3:])
+        # a is a temporary array owned by overlay and modified in-place
+        alpha = a[..., 3:].copy()
+        x = b[..., 3:] * (1.0 - alpha)
         b *= x
-        b += a * a[..., 3:]
-        b[..., 3] = a[..., 3] + x[..., 0]
+        a *= alpha
+        b += a
+        numpy.add(alpha[..., 0], x[..., 0], out=b[..., 3])
         b[..., :3] /= b[..., 3:]
 
     composite = numpy.zeros((*shape, 4))
@@ -3885,10 +4400,30 @@ def logger() -> logging.Logger:
 
 def product(iterable: Iterable[int]) -> int:
     """Return product of sequence of numbers."""
-    prod = 1
-    for i in iterable:
-        prod *= i
-    return prod
+    return math.prod(iterable)
+
+
+def array_equal(a: NDArray[Any] | None, b: NDArray[Any] | None, /) -> bool:
+    """Return whether two arrays have the same shape and elements.
+
+    Integer arrays of the same data type are compared as bytes.
+
+    """
+    if a is b:
+        return True
+    if a is None or b is None:
+        return False
+    if a.shape != b.shape:
+        return False
+    if a.size == 0:
+        return True
+    if a.dtype != b.dtype or a.dtype.kind not in 'biu':
+        # different byte orders or floating point; shapes already match
+        return bool((a == b).all())
+    return bool(
+        numpy.ascontiguousarray(a).data.cast('B')
+        == numpy.ascontiguousarray(b).data.cast('B')
+    )
 
 
 def indent(*args: Any, sep: str = '', end: str = '') -> str:
@@ -3896,14 +4431,8 @@ def indent(*args: Any, sep: str = '', end: str = '') -> str:
     text = (sep + '\n').join(
         arg if isinstance(arg, str) else repr(arg) for arg in args
     )
-    return (
-        '\n'.join(
-            ('    ' + line if line else line)
-            for line in text.splitlines()
-            if line
-        )[4:]
-        + end
-    )
+    # indent all but first non-empty line in one join
+    return '\n    '.join(line for line in text.splitlines() if line) + end
 
 
 def enumstr(v: enum.Enum | None, /) -> str:
@@ -3926,6 +4455,7 @@ def enumstr(v: enum.Enum | None, /) -> str:
 
 def test(verbose: bool = False) -> None:
     """Test TiffImageSourceData and TiffImageResources classes."""
+    import tempfile
     from glob import glob
 
     import imagecodecs
@@ -3940,8 +4470,15 @@ def test(verbose: bool = False) -> None:
     )
 
     for filename in glob('tests/*.tif'):
-        if read_tifftag(filename, 34377) is not None:
-            res1 = TiffImageResources.fromtiff(filename)
+        # open each file once and read both tag values
+        with tifffile.TiffFile(filename) as tif:
+            tags = tif.pages[0].aspage().tags
+            imageresources = tags.valueof(34377)
+            imagesourcedata = tags.valueof(37724)
+        name = os.path.split(filename)[-1]
+
+        if imageresources is not None:
+            res1 = TiffImageResources.frombytes(imageresources, name=name)
             assert str(res1)
             if verbose:
                 print(res1)
@@ -3949,7 +4486,7 @@ def test(verbose: bool = False) -> None:
             res2 = TiffImageResources.frombytes(res1.tobytes())
             assert res1 == res2, (filename, res1, res2)
 
-        isd1 = TiffImageSourceData.fromtiff(filename)
+        isd1 = TiffImageSourceData.frombytes(imagesourcedata, name=name)
         assert str(isd1)
         if verbose:
             print(isd1)
@@ -3967,7 +4504,9 @@ def test(verbose: bool = False) -> None:
         for psdformat in PsdFormat:
             unknown = has_unknown and psdformat == isd1.psdformat
             if not unknown:
-                isd1 = TiffImageSourceData.fromtiff(filename, unknown=False)
+                isd1 = TiffImageSourceData.frombytes(
+                    imagesourcedata, name=name, unknown=False
+                )
             for compression in PsdCompressionType:
                 if compression == PsdCompressionType.UNKNOWN:
                     continue
@@ -3999,6 +4538,71 @@ def test(verbose: bool = False) -> None:
         assert isd1 == TiffImageSourceData.frombytes(tagvalue)
         print('.', end=' ', flush=True)
 
+    # test decompress raises ValueError for corrupt channel data
+    image = numpy.arange(256, dtype='>u2').reshape(16, 16)
+    for compression in (
+        PsdCompressionType.ZIP,
+        PsdCompressionType.ZIP_PREDICTED,
+    ):
+        data = compress(image, compression, '>H')
+        assert array_equal(
+            decompress(data, compression, image.shape, image.dtype, '>H'),
+            image,
+        )
+        for data in (
+            data[: len(data) // 2],
+            compress(numpy.tile(image, 2), compression, '>H'),
+        ):
+            try:
+                decompress(data, compression, image.shape, image.dtype, '>H')
+            except ValueError:
+                pass
+            else:
+                raise AssertionError(compression)
+
+    # test decompress raises ValueError for corrupt RLE byte count tables
+    compression = PsdCompressionType.RLE
+    data = compress(image, compression, '>H')
+    assert array_equal(
+        decompress(data, compression, image.shape, image.dtype, '>H'), image
+    )
+    counts = numpy.frombuffer(data, dtype='>H', count=image.shape[0])
+    for corrupt in (
+        data[: counts.nbytes // 2],
+        (counts + 1000).astype('>H').tobytes() + data[counts.nbytes :],
+        (counts - 1).astype('>H').tobytes() + data[counts.nbytes :],
+    ):
+        try:
+            decompress(corrupt, compression, image.shape, image.dtype, '>H')
+        except ValueError:
+            pass
+        else:
+            raise AssertionError(compression)
+
+    # test ImageSourceData tag containing only the signature
+    with tempfile.TemporaryDirectory() as tempdir:
+        filename = os.path.join(tempdir, 'signature.tif')
+        signature = TiffImageSourceData.SIGNATURE
+        tifffile.imwrite(
+            filename,
+            numpy.zeros((64, 64), numpy.uint8),
+            extratags=[(37724, 7, len(signature), signature, True)],
+        )
+        isd1 = TiffImageSourceData.fromtiff(filename)
+        assert isd1.psdformat == PsdFormat.BE32BIT
+        assert isd1 == TiffImageSourceData.frombytes(signature)
+
+    # test pseudo-members of PsdResourceId are distinct and keep values
+    path0 = PsdResourceId(2500)
+    path1 = PsdResourceId(2600)
+    assert path0 is not path1
+    assert path0.value == 2500 and path1.value == 2600
+    assert path0.name == path1.name == 'PATH_INFO'
+    assert path0 is PsdResourceId(2500)
+    assert PsdResourceId.PATH_INFO.value == 2000
+    assert PsdResourceId(9999).value == 9999
+    assert PsdResourceId.UNKNOWN.value == -1
+
     print()
     # TODO: test TiffImageResources
 
@@ -4013,12 +4617,13 @@ def main(argv: list[str] | None = None) -> int:
     """
     from glob import glob
 
-    from matplotlib import pyplot
     from tifffile import TiffFile, imshow
 
     if argv is None:
         argv = sys.argv
 
+    maxworkers = os.cpu_count() or 1
+
     if len(argv) > 1 and '--test' in argv:
         if os.path.exists('../tests'):
             os.chdir('../')
@@ -4039,12 +4644,22 @@ def main(argv: list[str] | None = None) -> int:
         print()
         return 0
 
+    def tiff_files(path: str, /) -> list[str]:
+        # return paths of TIFF files in directory
+        with os.scandir(path) as it:
+            return [
+                entry.path
+                for entry in it
+                if entry.name.lower().endswith(('.tif', '.tiff'))
+                and entry.is_file()
+            ]
+
     if len(argv) == 1:
-        files = glob('*.tif')
+        files = tiff_files(os.curdir)
     elif '*' in argv[1]:
         files = glob(argv[1])
     elif os.path.isdir(argv[1]):
-        files = glob(f'{argv[1]}/*.tif')
+        files = tiff_files(argv[1])
     else:
         files = argv[1:]
 
@@ -4078,7 +4693,9 @@ def main(argv: list[str] | None = None) -> int:
                         print()
 
             if imagesourcedata is not None:
-                isd = TiffImageSourceData.frombytes(imagesourcedata, name=name)
+                isd = TiffImageSourceData.frombytes(
+                    imagesourcedata, name=name, maxworkers=maxworkers
+                )
                 print(isd)
                 print()
                 if isd.layers and len(files) == 1:
@@ -4091,6 +4708,8 @@ def main(argv: list[str] | None = None) -> int:
                             print(f'Layer {layer.name!r} image size is zero')
 
             if doplot:
+                from matplotlib import pyplot
+
                 pyplot.show()
 
         except ValueError as exc: